@@ -0,0 +1,11 @@
+# Gunicorn settings, picked up automatically by `gunicorn crud:app`.
+# The endpoints spend most of their time waiting on Postgres, so gevent
+# workers let each process keep many requests in flight instead of blocking
+# one request per worker. The gevent worker monkey-patches the standard
+# library, and psycopg 3 waits on sockets through it, so database calls yield
+# to other greenlets without any extra wait callback.
+# Localhost only, like `app.run`; deployments override with `--bind`.
+bind = '127.0.0.1:8000'
+worker_class = 'gevent'
+workers = 4
+worker_connections = 1000